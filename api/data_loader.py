@@ -7,7 +7,30 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
+
+# Try to import orjson, fallback to stdlib json if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _pick_stream(streams_by_language: Dict) -> Tuple[Optional[str], Optional[str]]:
+    """Redirect ID and provider of the first stream to play (prefer Deutsch, else any language)"""
+    german_streams = streams_by_language.get('Deutsch')
+    if german_streams:
+        _, found, redirect_id = german_streams[0].get('stream_url', '').rpartition('/redirect/')
+        if found:
+            return redirect_id, german_streams[0].get('provider', '')
+
+    for streams in streams_by_language.values():
+        if streams:
+            _, found, redirect_id = streams[0].get('stream_url', '').rpartition('/redirect/')
+            if found:
+                return redirect_id, streams[0].get('provider', '')
+
+    return None, None
 
 class DataLoader:
     def __init__(self, json_files: List[str] = None, site_name: str = None):
@@ -86,8 +109,8 @@ class DataLoader:
                 site_name = self._extract_site_name(json_file)
                 logging.info(f"Loading {site_name} data from: {json_file}")
 
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(json_file, 'rb') as f:
+                    data = orjson.loads(f.read()) if ORJSON_AVAILABLE else json.load(f)
                     site_series = data.get('series', [])
 
                     # Tag each series with its source site
@@ -147,10 +170,8 @@ class DataLoader:
                     # Extract redirect IDs from streams
                     for language, streams in episode.get('streams_by_language', {}).items():
                         for stream in streams:
-                            stream_url = stream.get('stream_url', '')
-                            if '/redirect/' in stream_url:
-                                redirect_id = stream_url.split('/redirect/')[-1]
-
+                            _, found, redirect_id = stream.get('stream_url', '').rpartition('/redirect/')
+                            if found:
                                 self.redirect_lookup[redirect_id] = {
                                     'series_idx': series_idx,
                                     'series_name': series_name,
@@ -181,27 +202,7 @@ class DataLoader:
 
             # Only include episodes with streams
             if episode.get('total_streams', 0) > 0:
-                # Get first available redirect (prefer Deutsch)
-                redirect_id = None
-                provider = None
-
-                # Try Deutsch first
-                german_streams = episode.get('streams_by_language', {}).get('Deutsch', [])
-                if german_streams:
-                    stream_url = german_streams[0].get('stream_url', '')
-                    if '/redirect/' in stream_url:
-                        redirect_id = stream_url.split('/redirect/')[-1]
-                        provider = german_streams[0].get('provider', '')
-
-                # Fallback to any language
-                if not redirect_id:
-                    for language, streams in episode.get('streams_by_language', {}).items():
-                        if streams:
-                            stream_url = streams[0].get('stream_url', '')
-                            if '/redirect/' in stream_url:
-                                redirect_id = stream_url.split('/redirect/')[-1]
-                                provider = streams[0].get('provider', '')
-                                break
+                redirect_id, provider = _pick_stream(episode.get('streams_by_language') or {})
 
                 if redirect_id:
                     episodes.append({
@@ -5,6 +5,7 @@ main.py - Simple Streaming API for Jellyfin (VOE-focused with absolute URLs)
 import logging
 import time
 import os
+import signal
 import requests
 from flask import Flask, redirect, jsonify, request, Response
 from urllib.parse import urljoin, urlparse
@@ -33,6 +34,7 @@ app = Flask(__name__)
 
 # Global components
 data_loader = None
+data_loaded_at = None  # When the current series data was loaded (changes on SIGHUP reload)
 redirect_resolver = None
 voe_provider = None
 simple_cache = {}  # redirect_id -> {'stream_url': url, 'expires': timestamp, 'provider': str}
@@ -46,6 +48,29 @@ LANGUAGE_PREFERENCES = {
     'german_sub': False  # Include German subtitled streams as fallback
 }
 
+def reload_data():
+    """Load the series data into a new DataLoader and swap it in once it is complete"""
+    global data_loader, data_loaded_at
+    logging.info("🔄 Reloading series data...")
+    try:
+        new_loader = DataLoader()
+        new_loader.load()
+    except Exception as e:
+        logging.error(f"❌ Reload failed, keeping current data: {e}")
+        return
+
+    # Handlers bind data_loader once per request, so requests in flight finish on the old loader
+    data_loader = new_loader
+    data_loaded_at = time.time()
+    # Season locks are keyed by series index, which the new data may order differently
+    season_caching_locks.clear()
+    logging.info(f"✅ Reloaded {new_loader.get_series_count()} series with {new_loader.get_redirect_count()} streams")
+
+def _handle_sighup(signum, frame):
+    """Reload series data on SIGHUP (sent by utils/manual_updater.py after a push) without a restart"""
+    import threading
+    threading.Thread(target=reload_data, daemon=True).start()
+
 def is_cache_valid(cache_entry):
     """Check if cache entry is still valid"""
     return cache_entry['expires'] > time.time()
@@ -60,8 +85,8 @@ def cache_stream(redirect_id, stream_url, provider_type):
     }
     logging.info(f"📦 Cached {redirect_id} ({provider_type}) expires in {CACHE_HOURS}h")
 
-def _start_season_caching(episode_info, current_redirect_id):
-    """Start background caching for the whole season"""
+def _start_season_caching(loader, episode_info, current_redirect_id):
+    """Start background caching for the whole season (loader: the DataLoader episode_info came from)"""
     try:
         series_idx = episode_info.get('series_idx')
         season_num = episode_info.get('season_num')
@@ -81,7 +106,7 @@ def _start_season_caching(episode_info, current_redirect_id):
         season_caching_locks.add(season_lock_key)
         
         # Get all episodes in this season
-        season_episodes = data_loader.get_season_episodes(series_idx, season_num)
+        season_episodes = loader.get_season_episodes(series_idx, season_num)
         
         logging.info(f"🔄 Starting background caching for {len(season_episodes)} episodes in season {season_num}")
         
@@ -89,7 +114,7 @@ def _start_season_caching(episode_info, current_redirect_id):
         import threading
         thread = threading.Thread(
             target=_cache_season_background, 
-            args=(season_episodes, current_redirect_id, season_lock_key),
+            args=(loader, season_episodes, current_redirect_id, season_lock_key),
             daemon=True
         )
         thread.start()
@@ -97,7 +122,7 @@ def _start_season_caching(episode_info, current_redirect_id):
     except Exception as e:
         logging.error(f"Error starting season caching: {e}")
 
-def _cache_season_background(season_episodes, skip_redirect_id, season_lock_key):
+def _cache_season_background(loader, season_episodes, skip_redirect_id, season_lock_key):
     """Background function to cache season episodes"""
     import time
     
@@ -120,7 +145,7 @@ def _cache_season_background(season_episodes, skip_redirect_id, season_lock_key)
                 logging.info(f"🔄 Background caching: {redirect_id}")
 
                 # Get episode info to determine site
-                ep_info = data_loader.find_episode_by_redirect(redirect_id)
+                ep_info = loader.find_episode_by_redirect(redirect_id)
                 if not ep_info:
                     continue
 
@@ -150,6 +175,7 @@ def _cache_season_background(season_episodes, skip_redirect_id, season_lock_key)
 @app.route('/stream/direct/<redirect_id>')
 def stream_direct(redirect_id):
     """Direct redirect endpoint - sends 302 redirect to actual m3u8 URL for better Jellyfin compatibility"""
+    loader = data_loader  # One dataset for the whole request, even if a reload swaps it meanwhile
     try:
         logging.info(f"🎬 Direct stream request for redirect {redirect_id}")
 
@@ -162,7 +188,7 @@ def stream_direct(redirect_id):
             logging.info(f"🔍 No cache found for {redirect_id}, resolving fresh...")
 
             # Find episode info
-            episode_info = data_loader.find_episode_by_redirect(redirect_id)
+            episode_info = loader.find_episode_by_redirect(redirect_id)
             if not episode_info:
                 return jsonify({"error": f"Redirect ID {redirect_id} not found"}), 404
 
@@ -185,7 +211,7 @@ def stream_direct(redirect_id):
                 # Cache the result
                 cache_stream(redirect_id, direct_url, provider_type)
                 # Start background season caching
-                _start_season_caching(episode_info, redirect_id)
+                _start_season_caching(loader, episode_info, redirect_id)
             else:
                 logging.warning("⚠️ VOE extraction failed")
                 return jsonify({"error": "Failed to extract stream"}), 500
@@ -203,6 +229,7 @@ def stream_direct(redirect_id):
 @app.route('/stream/redirect/<redirect_id>')
 def stream_redirect(redirect_id):
     """Main streaming endpoint - returns M3U8 with absolute URLs"""
+    loader = data_loader  # One dataset for the whole request, even if a reload swaps it meanwhile
     try:
         logging.info(f"🎬 Stream request for redirect {redirect_id}")
 
@@ -215,7 +242,7 @@ def stream_redirect(redirect_id):
             logging.info(f"🔍 No cache found for {redirect_id}, resolving fresh...")
             
             # Find episode info
-            episode_info = data_loader.find_episode_by_redirect(redirect_id)
+            episode_info = loader.find_episode_by_redirect(redirect_id)
             if not episode_info:
                 logging.warning(f"❌ Redirect ID {redirect_id} not found in data")
                 return jsonify({'error': 'Redirect ID not found'}), 404
@@ -244,7 +271,7 @@ def stream_redirect(redirect_id):
                 # Cache the result
                 cache_stream(redirect_id, direct_url, provider_type)
                 # Start background season caching
-                _start_season_caching(episode_info, redirect_id)
+                _start_season_caching(loader, episode_info, redirect_id)
             else:
                 logging.warning("⚠️ VOE extraction failed, falling back to direct URL")
                 return redirect(provider_url)
@@ -311,6 +338,7 @@ def stream_redirect(redirect_id):
 @app.route('/health')
 def health():
     """Health check endpoint"""
+    loader = data_loader
     # Clean expired cache entries
     current_time = time.time()
     expired_keys = [k for k, v in simple_cache.items() if v['expires'] <= current_time]
@@ -332,15 +360,17 @@ def health():
         'cache_by_provider': cache_by_provider,
         'cache_cleaned': len(expired_keys),
         'cache_duration_hours': CACHE_HOURS,
-        'series_count': data_loader.get_series_count() if data_loader else 0,
-        'redirect_count': data_loader.get_redirect_count() if data_loader else 0,
+        'series_count': loader.get_series_count() if loader else 0,
+        'redirect_count': loader.get_redirect_count() if loader else 0,
+        'loaded_at': data_loaded_at,
         'log_file': log_file
     })
 
 @app.route('/info/<redirect_id>')
 def redirect_info(redirect_id):
     """Get info about a redirect ID (for debugging)"""
-    episode_info = data_loader.find_episode_by_redirect(redirect_id)
+    loader = data_loader
+    episode_info = loader.find_episode_by_redirect(redirect_id)
     if not episode_info:
         return jsonify({'error': 'Redirect ID not found'}), 404
     
@@ -358,9 +388,10 @@ def redirect_info(redirect_id):
 @app.route('/test/<redirect_id>')
 def test_redirect(redirect_id):
     """Test redirect resolution without caching (for debugging)"""
+    loader = data_loader
     try:
         # Get episode info to determine source site
-        episode_info = data_loader.find_episode_by_redirect(redirect_id)
+        episode_info = loader.find_episode_by_redirect(redirect_id)
         source_site = episode_info.get('source_site', 'serienstream') if episode_info else 'serienstream'
 
         redirect_url = f"https://{source_site}.to/redirect/{redirect_id}"
@@ -399,10 +430,11 @@ def test_redirect(redirect_id):
 @app.route('/stats')
 def stats():
     """Get API statistics"""
-    if not data_loader:
+    loader = data_loader
+    if not loader:
         return jsonify({'error': 'Data not loaded'}), 500
     
-    return jsonify(data_loader.get_stats())
+    return jsonify(loader.get_stats())
 
 @app.route('/clear-cache')
 def clear_cache():
@@ -422,7 +454,7 @@ def internal_error(error):
     return jsonify({'error': 'Internal server error'}), 500
 
 def main():
-    global data_loader, redirect_resolver, voe_provider
+    global data_loader, data_loaded_at, redirect_resolver, voe_provider
     
     print("🚀 Starting VOE-focused Streaming API...")
     logging.info("🚀 Starting VOE-focused Streaming API...")
@@ -442,6 +474,7 @@ def main():
     
     try:
         data_loader.load()
+        data_loaded_at = time.time()
         stats_data = data_loader.get_stats()
 
         print(f"✅ Loaded {data_loader.get_series_count()} series with {data_loader.get_redirect_count()} streams")
@@ -474,6 +507,9 @@ def main():
         logging.error(f"❌ Failed to load data: {e}")
         return
     
+    # Reload the data on SIGHUP instead of needing a restart
+    signal.signal(signal.SIGHUP, _handle_sighup)
+    
     print("🌐 Starting Flask server on http://localhost:3000")
     print("📋 Available endpoints:")
     print("   GET /stream/redirect/<id>  - Main streaming endpoint")
@@ -483,6 +519,7 @@ def main():
     print("   GET /stats                 - API statistics")
     print("   GET /clear-cache           - Clear all cached streams")
     print("   Example: http://localhost:3000/stream/redirect/11050650")
+    print("   SIGHUP                     - Reload series data")
     
     logging.info("🌐 Starting Flask server on http://localhost:3000")
     logging.info("📋 Available endpoints:")
@@ -493,6 +530,7 @@ def main():
     logging.info("   GET /stats                 - API statistics")
     logging.info("   GET /clear-cache           - Clear all cached streams")
     logging.info("   Example: http://localhost:3000/stream/redirect/11050650")
+    logging.info("   SIGHUP                     - Reload series data")
     
     # Start server
     app.run(
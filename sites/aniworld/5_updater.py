@@ -248,9 +248,12 @@ class AniworldEpisodeUpdater:
             import shutil
             shutil.copy(self.db_file, backup_path)
 
-        # Save updated database
-        with open(self.db_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Save updated database via a temp file, never in place
+        # (backups made by the manual updater are hardlinks to the current file)
+        tmp_file = Path(str(self.db_file) + '.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        tmp_file.replace(self.db_file)
 
     def find_series_in_db(self, db: Dict, series_url: str) -> Tuple[int, Dict]:
         """
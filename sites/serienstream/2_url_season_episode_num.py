@@ -17,20 +17,24 @@ from pathlib import Path
 import config
 
 class SeriesStructureAnalyzer:
-    def __init__(self, limit: Optional[int] = None, batch_size: Optional[int] = None):
+    def __init__(self, limit: Optional[int] = None, batch_size: Optional[int] = None,
+                 catalog: Optional[Dict] = None, data_dir: Optional[str] = None):
         self.limit = limit
         self.batch_size = batch_size
+        self.catalog = catalog  # In-memory catalog used instead of the input file
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
-        self.data_folder = Path(config.DATA_DIR)
+        self.data_folder = Path(data_dir) if data_dir else Path(config.DATA_DIR)
         self.input_file = self.data_folder / "tmp_name_url.json"
         self.output_file = self.data_folder / "tmp_season_episode_data.json"
     
     def load_series_data(self) -> List[Dict]:
         """Load series URLs from input file"""
+        if self.catalog is not None:
+            return self.catalog.get('series', [])
         try:
             with open(self.input_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -358,6 +362,11 @@ class SeriesStructureAnalyzer:
                 print(f"❌ Error saving results: {e}")
                 return False
 
+def run(limit: Optional[int] = None, batch_size: Optional[int] = None, catalog: Optional[Dict] = None,
+        data_dir: Optional[str] = None) -> bool:
+    """Run the analyzer without argument parsing (used by utils/manual_updater.py)"""
+    return SeriesStructureAnalyzer(limit=limit, batch_size=batch_size, catalog=catalog, data_dir=data_dir).run()
+
 def main():
     """Main function"""
     import argparse
@@ -365,11 +374,12 @@ def main():
     parser = argparse.ArgumentParser(description='Series Structure Analyzer')
     parser.add_argument('--limit', type=int, help='Limit number of series to process')
     parser.add_argument('-b', '--batch', type=int, help='Batch processing size (e.g., -b 100)')
+    parser.add_argument('--data-dir', help='Read and write the tmp files in this folder instead of data/')
     args = parser.parse_args()
     
     print(f"DEBUG: limit={args.limit}, batch={args.batch}")
     
-    analyzer = SeriesStructureAnalyzer(limit=args.limit, batch_size=args.batch)
+    analyzer = SeriesStructureAnalyzer(limit=args.limit, batch_size=args.batch, data_dir=args.data_dir)
     
     try:
         success = analyzer.run()
@@ -18,7 +18,8 @@ import config
 from urllib.parse import urljoin
 
 class EpisodeStreamsAnalyzer:
-    def __init__(self, limit: Optional[int] = None, batch_size: Optional[int] = None):
+    def __init__(self, limit: Optional[int] = None, batch_size: Optional[int] = None,
+                 data_dir: Optional[str] = None):
         self.limit = limit
         self.batch_size = batch_size
         self.base_url = "https://serienstream.to"
@@ -27,7 +28,7 @@ class EpisodeStreamsAnalyzer:
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
         
-        self.data_folder = Path(config.DATA_DIR)
+        self.data_folder = Path(data_dir) if data_dir else Path(config.DATA_DIR)
         self.input_file = self.data_folder / "tmp_season_episode_data.json"
         self.output_file = self.data_folder / "tmp_episode_streams.json"
     
@@ -466,6 +467,10 @@ class EpisodeStreamsAnalyzer:
                 print(f"❌ Error saving results: {e}")
                 return False
 
+def run(limit: Optional[int] = None, batch_size: Optional[int] = None, data_dir: Optional[str] = None) -> bool:
+    """Run the analyzer without argument parsing (used by utils/manual_updater.py)"""
+    return EpisodeStreamsAnalyzer(limit=limit, batch_size=batch_size, data_dir=data_dir).run()
+
 def main():
     """Main function"""
     import argparse
@@ -473,11 +478,12 @@ def main():
     parser = argparse.ArgumentParser(description='Episode Streams Analyzer')
     parser.add_argument('--limit', type=int, help='Limit number of series to process')
     parser.add_argument('-b', '--batch', type=int, help='Batch processing size (e.g., -b 10)')
+    parser.add_argument('--data-dir', help='Read and write the tmp files in this folder instead of data/')
     args = parser.parse_args()
     
     print(f"DEBUG: limit={args.limit}, batch={args.batch}")
     
-    analyzer = EpisodeStreamsAnalyzer(limit=args.limit, batch_size=args.batch)
+    analyzer = EpisodeStreamsAnalyzer(limit=args.limit, batch_size=args.batch, data_dir=args.data_dir)
     
     try:
         success = analyzer.run()
@@ -3,7 +3,7 @@
 JSON Structurer
 Combines all temp JSON files into final structured data
 Input: data/tmp_name_url.json, data/tmp_season_episode_data.json, data/tmp_episode_streams.json
-Output: data/final_series_data.json
+Output: data/final_series_data.json (or [--output-file] [path])
 set limit with [--limit] [num] flag.
 """
 
@@ -15,14 +15,18 @@ from pathlib import Path
 import config
 
 class JSONStructurer:
-    def __init__(self, limit: Optional[int] = None):
+    def __init__(self, limit: Optional[int] = None, output_file: Optional[str] = None,
+                 single_series: bool = False, catalog: Optional[Dict] = None,
+                 data_dir: Optional[str] = None):
         self.limit = limit
+        self.single_series = single_series
+        self.catalog = catalog  # In-memory catalog used instead of tmp_name_url.json
         
-        self.data_folder = Path(config.DATA_DIR)
+        self.data_folder = Path(data_dir) if data_dir else Path(config.DATA_DIR)
         self.name_url_file = self.data_folder / "tmp_name_url.json"
         self.structure_file = self.data_folder / "tmp_season_episode_data.json"
         self.streams_file = self.data_folder / "tmp_episode_streams.json"
-        self.output_file = self.data_folder / "final_series_data.json"
+        self.output_file = Path(output_file) if output_file else self.data_folder / "final_series_data.json"
     
     def generate_jellyfin_name(self, series_name: str, start_date: str) -> str:
         """Generate a clean Jellyfin-compatible name with year"""
@@ -154,7 +158,7 @@ class JSONStructurer:
         
         # Load all input files
         print("📥 Loading input files...")
-        name_url_data = self.load_json_file(self.name_url_file)
+        name_url_data = self.catalog if self.catalog is not None else self.load_json_file(self.name_url_file)
         structure_data = self.load_json_file(self.structure_file)
         streams_data = self.load_json_file(self.streams_file)
         
@@ -265,10 +269,16 @@ class JSONStructurer:
             'series': final_series
         }
         
-        # Save final data
+        # Save final data (just the first series record with --single-series)
+        if self.single_series:
+            output_data = final_series[0] if final_series else None
         try:
-            with open(self.output_file, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            # Written to a temp file and swapped in, never rewritten in place
+            # (database backups are hardlinks to the current file)
+            tmp_file = self.output_file.with_name(self.output_file.name + '.tmp')
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(output_data, f, ensure_ascii=False, separators=(',', ':'))
+            tmp_file.replace(self.output_file)
             
             duration = time.time() - start_time
             file_size = self.output_file.stat().st_size / (1024 * 1024)
@@ -284,18 +294,29 @@ class JSONStructurer:
             print(f"❌ Error saving final data: {e}")
             return False
 
+def run(limit: Optional[int] = None, output_file: Optional[str] = None, single_series: bool = False,
+        catalog: Optional[Dict] = None, data_dir: Optional[str] = None) -> bool:
+    """Run the structurer without argument parsing (used by utils/manual_updater.py)"""
+    return JSONStructurer(limit=limit, output_file=output_file, single_series=single_series,
+                          catalog=catalog, data_dir=data_dir).run()
+
 def main():
     """Main function"""
     import argparse
     
     parser = argparse.ArgumentParser(description='JSON Structurer')
     parser.add_argument('--limit', type=int, help='Limit number of series to process')
+    parser.add_argument('--output-file', help='Write to this file instead of data/final_series_data.json')
+    parser.add_argument('--single-series', action='store_true',
+                        help='Write only the first series record instead of the full database')
+    parser.add_argument('--data-dir', help='Read and write the tmp files in this folder instead of data/')
     args = parser.parse_args()
     
     # Use limit only if specified
     limit = args.limit
     
-    structurer = JSONStructurer(limit=limit)
+    structurer = JSONStructurer(limit=limit, output_file=args.output_file, single_series=args.single_series,
+                                data_dir=args.data_dir)
     
     try:
         success = structurer.run()
@@ -38,6 +38,35 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# Shared read-only fallback for content without a streams_by_language dict
+_EMPTY_STREAMS = {}
+
+class _Stats:
+    """Run counters; attribute increments avoid a dict get/set per episode"""
+    __slots__ = (
+        'series_processed', 'series_created', 'seasons_created',
+        'episodes_created', 'movies_created',
+        'episodes_skipped_no_streams', 'episodes_skipped_no_language',
+        'movies_skipped_no_streams', 'movies_skipped_no_language',
+        'episodes_by_language', 'movies_by_language',
+        'errors', 'last_disk_check'
+    )
+    
+    def __init__(self, languages):
+        self.series_processed = 0
+        self.series_created = 0
+        self.seasons_created = 0
+        self.episodes_created = 0
+        self.movies_created = 0
+        self.episodes_skipped_no_streams = 0
+        self.episodes_skipped_no_language = 0
+        self.movies_skipped_no_streams = 0
+        self.movies_skipped_no_language = 0
+        self.episodes_by_language = {language: 0 for language in languages}
+        self.movies_by_language = {language: 0 for language in languages}
+        self.errors = 0
+        self.last_disk_check = 0
+
 class JellyfinStructureGenerator:
     def __init__(self, output_dir=None, api_base_url="http://localhost:3000/api/stream/redirect"):
         self.output_dir = Path(output_dir) if output_dir else Path(config.JELLYFIN_OUTPUT_DIR)
@@ -57,26 +86,17 @@ class JellyfinStructureGenerator:
         # self.ENGLISH_ONLY = False  
         # self.GERMAN_SUB_ONLY = False
         
+        # Tuple copies used by the per-episode lookup in get_best_redirect
+        self._lang_priority = tuple(self.LANGUAGE_PRIORITY)
+        self._provider_priority = ('VOE', 'Vidoza', 'Doodstream')
+        
         # Progress tracking
         self.progress_file = self.output_dir / '.structure_progress.json'
         self.processed_series = set()
+        self._processed_list = []  # Same entries as processed_series, in save order
         
         # Statistics with language breakdown
-        self.stats = {
-            'series_processed': 0,
-            'series_created': 0,
-            'seasons_created': 0,
-            'episodes_created': 0,
-            'movies_created': 0,
-            'episodes_skipped_no_streams': 0,
-            'episodes_skipped_no_language': 0,
-            'movies_skipped_no_streams': 0,
-            'movies_skipped_no_language': 0,
-            'episodes_by_language': {'Deutsch': 0, 'Englisch': 0, 'mit deutschen Untertiteln': 0},
-            'movies_by_language': {'Deutsch': 0, 'Englisch': 0, 'mit deutschen Untertiteln': 0},
-            'errors': 0,
-            'last_disk_check': 0
-        }
+        self.stats = _Stats(self.LANGUAGE_PRIORITY)
     
     def find_json_file(self):
         """Find the series data JSON file"""
@@ -108,9 +128,10 @@ class JellyfinStructureGenerator:
         """Load previous progress"""
         if self.progress_file.exists():
             try:
-                with open(self.progress_file, 'r') as f:
+                with open(self.progress_file, 'r', encoding='utf-8') as f:
                     progress = json.load(f)
-                    self.processed_series = set(progress.get('processed_series', []))
+                    self._processed_list = progress.get('processed_series', [])
+                    self.processed_series = set(self._processed_list)
                 return True
             except Exception as e:
                 logging.warning(f"Could not load progress: {e}")
@@ -118,16 +139,18 @@ class JellyfinStructureGenerator:
     
     def save_progress(self, series_name):
         """Save progress after each series"""
-        self.processed_series.add(series_name)
+        if series_name not in self.processed_series:
+            self.processed_series.add(series_name)
+            self._processed_list.append(series_name)
         
         try:
             self.progress_file.parent.mkdir(parents=True, exist_ok=True)
             progress = {
-                'processed_series': list(self.processed_series),
+                'processed_series': self._processed_list,
                 'total_processed': len(self.processed_series)
             }
-            with open(self.progress_file, 'w') as f:
-                json.dump(progress, f, indent=2)
+            with open(self.progress_file, 'w', encoding='utf-8') as f:
+                json.dump(progress, f, ensure_ascii=False, separators=(',', ':'))
         except Exception as e:
             logging.warning(f"Could not save progress: {e}")
     
@@ -145,9 +168,9 @@ class JellyfinStructureGenerator:
             
             # Show disk status periodically
             current_time = time.time()
-            if (current_time - self.stats['last_disk_check'] > 600) or usage_percent > 85:
+            if (current_time - self.stats.last_disk_check > 600) or usage_percent > 85:
                 print(f"💾 Disk usage: {usage_percent:.1f}% ({used//1024//1024//1024}GB / {total//1024//1024//1024}GB)")
-                self.stats['last_disk_check'] = current_time
+                self.stats.last_disk_check = current_time
             
             if usage_percent > 90:
                 print(f"🚨 DISK CRITICAL: {usage_percent:.1f}% full! Aborting.")
@@ -164,34 +187,40 @@ class JellyfinStructureGenerator:
             filename = filename.replace(char, '')
         return filename.strip(' .')[:200] or "Unknown"
     
+    def _index_streams(self, content_data):
+        """Index redirect IDs by (language, provider) in a single pass over all streams"""
+        index = {}
+        streams_by_language = content_data.get('streams_by_language') or _EMPTY_STREAMS
+        for language, language_streams in streams_by_language.items():
+            for stream in language_streams:
+                _, found, redirect_id = stream.get('stream_url', '').rpartition('/redirect/')
+                if found and redirect_id:
+                    # First stream wins, matching the original scan order
+                    index.setdefault((language, stream.get('provider')), redirect_id)
+                    index.setdefault((language, None), redirect_id)
+        return index
+    
     def get_best_redirect(self, content_data):
         """Get best redirect URL with language priority fallback"""
-        streams_by_language = content_data.get('streams_by_language', {})
+        index = self._index_streams(content_data)
+        lookup = index.get
+        providers = self._provider_priority
         
         # Try languages in priority order
-        for language in self.LANGUAGE_PRIORITY:
-            language_streams = streams_by_language.get(language, [])
-            if not language_streams:
-                continue
-            
-            # Found streams in this language - try providers in order
-            for provider in ['VOE', 'Vidoza', 'Doodstream']:
-                for stream in language_streams:
-                    if stream.get('provider') == provider:
-                        stream_url = stream.get('stream_url', '')
-                        if '/redirect/' in stream_url:
-                            redirect_id = stream_url.split('/redirect/')[-1]
-                            return redirect_id, language  # Return both redirect and which language was used
+        for language in self._lang_priority:
+            # Try providers in order within this language
+            for provider in providers:
+                redirect_id = lookup((language, provider))
+                if redirect_id:
+                    return redirect_id, language  # Return both redirect and which language was used
             
             # If no preferred provider, use any redirect from this language
-            for stream in language_streams:
-                stream_url = stream.get('stream_url', '')
-                if '/redirect/' in stream_url:
-                    redirect_id = stream_url.split('/redirect/')[-1]
-                    return redirect_id, language
+            redirect_id = lookup((language, None))
+            if redirect_id:
+                return redirect_id, language
         
         # No streams found in any priority language
-        available_languages = list(streams_by_language.keys())
+        available_languages = list(content_data.get('streams_by_language') or _EMPTY_STREAMS)
         return None, available_languages
     
     def create_strm_file(self, strm_path, redirect_id):
@@ -203,7 +232,7 @@ class JellyfinStructureGenerator:
             return True
         except Exception as e:
             logging.error(f"Error creating {strm_path}: {e}")
-            self.stats['errors'] += 1
+            self.stats.errors += 1
             return False
     
     def process_movies(self, series_dir, movies_data):
@@ -211,46 +240,51 @@ class JellyfinStructureGenerator:
         if not movies_data:
             return
         
-        season_dir = series_dir / "Season 00"
-        season_dir.mkdir(parents=True, exist_ok=True)
+        season_dir_str = f"{os.fspath(series_dir)}/Season 00"
+        os.makedirs(season_dir_str, exist_ok=True)
         
+        stats = self.stats
         movies_created = 0
         for movie_key, movie_data in movies_data.items():
             movie_num = movie_key.replace('movie_', '')
             
             # Check if movie has streams
             if movie_data.get('total_streams', 0) == 0:
-                self.stats['movies_skipped_no_streams'] += 1
+                stats.movies_skipped_no_streams += 1
                 continue
             
             # Get redirect for priority languages
             redirect_id, used_language = self.get_best_redirect(movie_data)
             if not redirect_id:
-                self.stats['movies_skipped_no_language'] += 1
+                stats.movies_skipped_no_language += 1
                 continue
             
             # Track which language was used
             if isinstance(used_language, str):
-                self.stats['movies_by_language'][used_language] += 1
+                stats.movies_by_language[used_language] += 1
             
             # Create .strm file
-            strm_path = season_dir / f"S00E{movie_num.zfill(2)}.strm"
+            strm_path = f"{season_dir_str}/S00E{movie_num.zfill(2)}.strm"
             if self.create_strm_file(strm_path, redirect_id):
-                self.stats['movies_created'] += 1
+                stats.movies_created += 1
                 movies_created += 1
         
         if movies_created > 0:
-            self.stats['seasons_created'] += 1
+            stats.seasons_created += 1
     
     def process_episodes(self, series_dir, seasons_data):
         """Process regular episodes"""
         if not seasons_data:
             return
         
+        # Plain string paths: building Path objects per season/episode is measurable on large runs
+        series_dir_str = os.fspath(series_dir)
+        stats = self.stats
+        
         for season_key, season_data in seasons_data.items():
-            season_num = season_key.replace('season_', '')
-            season_dir = series_dir / f"Season {season_num.zfill(2)}"
-            season_dir.mkdir(parents=True, exist_ok=True)
+            season_num = season_key.replace('season_', '').zfill(2)
+            season_dir_str = f"{series_dir_str}/Season {season_num}"
+            os.makedirs(season_dir_str, exist_ok=True)
             
             episodes_data = season_data.get('episodes', {})
             if not episodes_data:
@@ -262,27 +296,27 @@ class JellyfinStructureGenerator:
                 
                 # Check if episode has streams
                 if episode_data.get('total_streams', 0) == 0:
-                    self.stats['episodes_skipped_no_streams'] += 1
+                    stats.episodes_skipped_no_streams += 1
                     continue
                 
                 # Get redirect for priority languages
                 redirect_id, used_language = self.get_best_redirect(episode_data)
                 if not redirect_id:
-                    self.stats['episodes_skipped_no_language'] += 1
+                    stats.episodes_skipped_no_language += 1
                     continue
                 
                 # Track which language was used
                 if isinstance(used_language, str):
-                    self.stats['episodes_by_language'][used_language] += 1
+                    stats.episodes_by_language[used_language] += 1
                 
                 # Create .strm file
-                strm_path = season_dir / f"S{season_num.zfill(2)}E{episode_num.zfill(2)}.strm"
+                strm_path = f"{season_dir_str}/S{season_num}E{episode_num.zfill(2)}.strm"
                 if self.create_strm_file(strm_path, redirect_id):
-                    self.stats['episodes_created'] += 1
+                    stats.episodes_created += 1
                     episodes_created += 1
             
             if episodes_created > 0:
-                self.stats['seasons_created'] += 1
+                stats.seasons_created += 1
     
     def process_series(self, series_data, series_idx, total_series):
         """Process a single series"""
@@ -306,9 +340,9 @@ class JellyfinStructureGenerator:
         self.process_episodes(series_dir, seasons_data)
         
         # Count as processed
-        self.stats['series_processed'] += 1
+        self.stats.series_processed += 1
         if movies_data or seasons_data:
-            self.stats['series_created'] += 1
+            self.stats.series_created += 1
     
     def generate_structure(self, limit=None, batch_size=1000, wait_minutes=0):
         """Main generation function"""
@@ -367,13 +401,13 @@ class JellyfinStructureGenerator:
                 
                 # Batch checkpoint
                 if idx % batch_size == 0:
-                    print(f"✅ Batch {idx}: {self.stats['episodes_created']} episodes, {self.stats['movies_created']} movies created")
+                    print(f"✅ Batch {idx}: {self.stats.episodes_created} episodes, {self.stats.movies_created} movies created")
                     progress_pct = ((already_processed + idx) / total_series) * 100
                     print(f"📊 Total progress: {already_processed + idx}/{total_series} ({progress_pct:.1f}%)")
                     
             except Exception as e:
                 logging.error(f"Error processing series {current_total}: {e}")
-                self.stats['errors'] += 1
+                self.stats.errors += 1
         
         self.print_final_stats()
     
@@ -383,30 +417,30 @@ class JellyfinStructureGenerator:
         print("📊 JELLYFIN STRUCTURE GENERATION COMPLETE")
         print("="*60)
         print("🌍 Language Priority: German → English → German Subtitles")
-        print(f"✅ Series processed: {self.stats['series_processed']:,}")
-        print(f"✅ Series created: {self.stats['series_created']:,}")
-        print(f"✅ Seasons created: {self.stats['seasons_created']:,}")
-        print(f"✅ Episodes created: {self.stats['episodes_created']:,}")
-        print(f"🎬 Movies created: {self.stats['movies_created']:,}")
+        print(f"✅ Series processed: {self.stats.series_processed:,}")
+        print(f"✅ Series created: {self.stats.series_created:,}")
+        print(f"✅ Seasons created: {self.stats.seasons_created:,}")
+        print(f"✅ Episodes created: {self.stats.episodes_created:,}")
+        print(f"🎬 Movies created: {self.stats.movies_created:,}")
         print()
         print("📺 Episodes by language:")
-        for lang, count in self.stats['episodes_by_language'].items():
+        for lang, count in self.stats.episodes_by_language.items():
             if count > 0:
                 print(f"   {lang}: {count:,}")
         print("🎬 Movies by language:")
-        for lang, count in self.stats['movies_by_language'].items():
+        for lang, count in self.stats.movies_by_language.items():
             if count > 0:
                 print(f"   {lang}: {count:,}")
         print()
-        print(f"⏭️  Episodes skipped (no streams): {self.stats['episodes_skipped_no_streams']:,}")
-        print(f"⏭️  Episodes skipped (no supported language): {self.stats['episodes_skipped_no_language']:,}")
-        print(f"⏭️  Movies skipped (no streams): {self.stats['movies_skipped_no_streams']:,}")
-        print(f"⏭️  Movies skipped (no supported language): {self.stats['movies_skipped_no_language']:,}")
-        print(f"❌ Errors: {self.stats['errors']:,}")
+        print(f"⏭️  Episodes skipped (no streams): {self.stats.episodes_skipped_no_streams:,}")
+        print(f"⏭️  Episodes skipped (no supported language): {self.stats.episodes_skipped_no_language:,}")
+        print(f"⏭️  Movies skipped (no streams): {self.stats.movies_skipped_no_streams:,}")
+        print(f"⏭️  Movies skipped (no supported language): {self.stats.movies_skipped_no_language:,}")
+        print(f"❌ Errors: {self.stats.errors:,}")
         print(f"📁 Output: {self.output_dir}")
         print("="*60)
         
-        total_content = self.stats['episodes_created'] + self.stats['movies_created']
+        total_content = self.stats.episodes_created + self.stats.movies_created
         if total_content > 0:
             print("🎯 Ready for Jellyfin!")
             print("   1. Scan library in Jellyfin")
@@ -4,45 +4,360 @@ Manual Series Updater
 Allows manual updating of series data in the database
 Works on both code server and Jellyfin server
 """
+import argparse
 import json
 import sys
 import os
+import io
+import contextlib
+import functools
+import hashlib
+import importlib.util
 from pathlib import Path
-from typing import Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional, Tuple
 import subprocess
 import shutil
+import shlex
+import socket
+import atexit
+import bisect
+import mmap
+import tempfile
+import threading
+import time
+import traceback
+import urllib.request
+
+# Try to import orjson, fallback to stdlib json if not available
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Repository root (absolute, so paths stay valid for subprocesses run with another cwd)
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
 
 # Add parent directory to path to import scrapers
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(PROJECT_ROOT))
+
+# Number of recent search results kept per database
+SEARCH_CACHE_SIZE = 32
+
+# Scraper scripts run by update_series_simple:
+# (script, progress label, failure message, --limit, subprocess timeout in seconds)
+PIPELINE_STEPS = [
+    ("2_url_season_episode_num", "Analyzing structure", "Structure analysis failed", 1, 120),
+    ("3_language_streamurl", "Analyzing streams", "Stream analysis failed", 1, 600),
+    ("4_json_structurer", "Structuring data", "JSON structuring failed", None, 30),
+]
+
+# Series updated at once by the batch updater (each in its own tmp folder); JS_UPDATE_PARALLEL overrides it
+UPDATE_WORKERS = 4
+
+# Scripts whose run() accepts the catalog in memory instead of reading tmp_name_url.json
+CATALOG_STEPS = {"2_url_season_episode_num", "4_json_structurer"}
+
+# Outputs of scripts 2 and 3 are cached per series URL and reused while the
+# series page's ETag/Last-Modified is unchanged and the entry is younger than the TTL
+UPDATE_CACHE_FILE = PROJECT_ROOT / "utils" / "update_cache.json"
+UPDATE_CACHE_TTL = 6 * 60 * 60
+CACHED_STEP_OUTPUTS = {
+    "2_url_season_episode_num": "tmp_season_episode_data.json",
+    "3_language_streamurl": "tmp_episode_streams.json",
+}
+
+# Files at least this large are parsed from a memory map; smaller ones are just read
+# (the map setup and page faults cost more than the copy they save)
+MMAP_MIN_SIZE = 1_000_000
+
+# Seconds to wait for the Jellyfin API to reload after SIGHUP before restarting it instead
+API_RELOAD_TIMEOUT = 30
+
+# Serialises read-modify-write of UPDATE_CACHE_FILE between parallel updates
+_update_cache_lock = threading.Lock()
+
+# Imported pipeline modules, keyed by (site, script); the lock keeps parallel updates
+# from importing a script twice (and from racing on the sys.modules['config'] swap)
+_site_modules = {}
+_site_modules_lock = threading.Lock()
+
+# SSH multiplexing: every ssh/scp call to the Jellyfin host shares one master connection
+SSH_HOST = "jellyfin"
+SSH_CONTROL_PATH = str(Path(tempfile.gettempdir()) / "js_ssh_%r@%h:%p")
+SSH_OPTIONS = [
+    "-o", f"ControlPath={SSH_CONTROL_PATH}",
+    "-o", "ControlMaster=auto",
+    "-o", "ControlPersist=300s",
+]
+
+def ssh_command(*remote_args: str) -> List[str]:
+    """Build an ssh command line for the Jellyfin host using the shared connection"""
+    return ["ssh", *SSH_OPTIONS, SSH_HOST, *remote_args]
+
+def scp_command(local_path: str, remote_path: str) -> List[str]:
+    """Build an scp command line to the Jellyfin host using the shared connection"""
+    return ["scp", *SSH_OPTIONS, local_path, f"{SSH_HOST}:{remote_path}"]
+
+def rsync_command(local_path: str, remote_path: str, compress_choice: Optional[str] = None) -> List[str]:
+    """
+    Build an rsync command line to the Jellyfin host using the shared connection
+    rsync only sends the changed blocks of the file and still swaps it in atomically on the server
+    compress_choice picks the algorithm (e.g. "zstd", rsync >= 3.2); the default is rsync's own choice
+    """
+    ssh = " ".join(shlex.quote(arg) for arg in ["ssh", *SSH_OPTIONS])
+    compress = ["-z", f"--compress-choice={compress_choice}"] if compress_choice else ["-z"]
+    return ["rsync", *compress, "-e", ssh, local_path, f"{SSH_HOST}:{remote_path}"]
+
+@functools.lru_cache(maxsize=None)
+def rsync_supports_zstd() -> bool:
+    """Whether the local rsync can compress with zstd (listed under "Compress list" since 3.2)"""
+    try:
+        version = subprocess.run(["rsync", "--version"], capture_output=True, text=True, timeout=5).stdout
+    except (OSError, subprocess.TimeoutExpired):
+        return False
+    return "zstd" in version
+
+def open_ssh_master():
+    """Start the shared SSH master connection in the background and close it on exit"""
+    try:
+        # Output goes to DEVNULL: the backgrounded master would otherwise hold our pipes open
+        result = subprocess.run(
+            ["ssh", *SSH_OPTIONS, "-M", "-N", "-f", SSH_HOST],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=15
+        )
+        if result.returncode == 0:
+            atexit.register(close_ssh_master)
+    except Exception:
+        # Not fatal: ControlMaster=auto opens a master on the first real call instead
+        pass
+
+def close_ssh_master():
+    """Stop the shared SSH master connection"""
+    try:
+        subprocess.run(
+            ["ssh", *SSH_OPTIONS, "-O", "exit", SSH_HOST],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            timeout=10
+        )
+    except Exception:
+        pass
+
+def read_json_file(path: Path):
+    """
+    Parse a JSON file (orjson when available)
+    Large files are parsed by orjson straight from a memory map, so no bytes copy of them is made first
+    """
+    if ORJSON_AVAILABLE:
+        with open(path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_SIZE:
+                # Also covers empty files, which mmap can't map (orjson raises its usual decode error)
+                return orjson.loads(f.read())
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                # The view is released before the map closes (closing with exports raises BufferError)
+                return orjson.loads(view)
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def write_json_file(path: Path, data, fsync: bool = False, pretty: bool = False):
+    """
+    Write data as compact UTF-8 JSON (orjson when available), or indented with pretty (for human copies only)
+    Writes to a temp file first and renames it over the target, so a crash never leaves a truncated file
+    With fsync the contents are flushed to disk before the rename (used for the databases)
+    Returns the bytes written
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if pretty else 0)
+        buf = orjson.dumps(data, option=option)
+    elif pretty:
+        buf = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+    else:
+        buf = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+    tmp_path = path.with_suffix(path.suffix + '.tmp')
+    try:
+        # Serialised once, written straight to the fd without a buffered file object
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(buf)
+            while view:
+                view = view[os.write(fd, view):]
+            if fsync:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return buf
+
+def backup_database(db_path: Path) -> Path:
+    """
+    Back up a database file as <name>.backup, keeping the previous backup as <name>.backup.prev
+    Uses a hardlink (no data copied). Only safe because every writer of the database replaces the file
+    (write_json_file here, 4_json_structurer.py and 5_updater.py via temp file + rename) instead of rewriting it
+    """
+    backup_path = db_path.with_suffix('.json.backup')
+    try:
+        backup_path.replace(backup_path.with_suffix('.backup.prev'))
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(db_path, backup_path)
+    except OSError:
+        # Filesystems without hardlink support: copyfile copies in the kernel (sendfile) on Linux
+        shutil.copyfile(db_path, backup_path)
+    return backup_path
+
+@functools.lru_cache(maxsize=None)
+def site_paths(site: str) -> Tuple[Path, Path, Path]:
+    """(site dir, data dir, database file) of a site, built once per site"""
+    site_dir = PROJECT_ROOT / "sites" / site
+    data_dir = site_dir / "data"
+    return site_dir, data_dir, data_dir / "final_series_data.json"
 
 def load_database(site: str) -> tuple:
     """Load database for a site"""
-    project_root = Path(__file__).parent.parent
-    db_path = project_root / f"sites/{site}/data/final_series_data.json"
+    _, _, db_path = site_paths(site)
 
     if not db_path.exists():
         print(f"❌ Database not found: {db_path}")
         return None, None
 
     try:
-        with open(db_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json_file(db_path)
+        build_name_index(data)
         print(f"✅ Loaded {len(data['series'])} series from {site}")
         return data, db_path
     except Exception as e:
         print(f"❌ Error loading database: {e}")
         return None, None
 
+def build_name_index(data: Dict) -> List[str]:
+    """Lowercase all series names once so searches don't redo it per query"""
+    data['_lower_names'] = [series['name'].lower() for series in data['series']]
+    return data['_lower_names']
+
+def build_name_corpus(data: Dict) -> tuple:
+    """
+    Join all lowercased names into one NUL-separated string plus the offset each name starts at
+    One str.find over the corpus replaces a Python-level `in` test per series
+    """
+    lower_names = data.get('_lower_names')
+    if lower_names is None:
+        lower_names = build_name_index(data)
+
+    starts = []
+    offset = 0
+    for name in lower_names:
+        starts.append(offset)
+        offset += len(name) + 1
+    starts.append(offset)  # sentinel: end of the last name
+
+    data['_name_corpus'] = ("\0".join(lower_names), starts)
+    return data['_name_corpus']
+
+def _scan_name_corpus(data: Dict, query: str) -> List[int]:
+    """Indices of all series whose lowercased name contains query, in database order"""
+    corpus, starts = data.get('_name_corpus') or build_name_corpus(data)
+    if not query:
+        return list(range(len(starts) - 1))
+    if "\0" in query:
+        # Would match across name boundaries
+        return []
+
+    indices = []
+    pos = corpus.find(query)
+    while pos != -1:
+        idx = bisect.bisect_right(starts, pos) - 1
+        indices.append(idx)
+        # Continue after this name so each series is reported once
+        pos = corpus.find(query, starts[idx + 1])
+    return indices
+
 def search_series(data: Dict, query: str) -> List[tuple]:
     """Search for series by name"""
     query = query.lower()
-    results = []
 
-    for idx, series in enumerate(data['series']):
-        if query in series['name'].lower():
-            results.append((idx, series))
+    lower_names = data.get('_lower_names')
+    if lower_names is None:
+        lower_names = build_name_index(data)
+
+    # Recent queries -> matching indices, kept per database (dropped on replace_series)
+    cache = data.setdefault('_search_cache', {})
+    indices = cache.pop(query, None)
+    if indices is None:
+        # Anything matching this query also matches every cached query contained in it,
+        # so scanning the smallest such result list is enough
+        candidates = None
+        for cached_query, cached_indices in cache.items():
+            if cached_query in query and (candidates is None or len(cached_indices) < len(candidates)):
+                candidates = cached_indices
+
+        if candidates is None:
+            indices = _scan_name_corpus(data, query)
+        else:
+            indices = [idx for idx in candidates if query in lower_names[idx]]
+
+        if len(cache) >= SEARCH_CACHE_SIZE:
+            del cache[next(iter(cache))]
+    cache[query] = indices
 
-    return results
+    return [(idx, data['series'][idx]) for idx in indices]
+
+def find_series_index(data: Dict, series_name: str) -> int:
+    """
+    Index of the first series whose jellyfin_name or name equals series_name, or -1
+    The lookup dict is built once per database and dropped by replace_series
+    """
+    index = data.get('_series_index')
+    if index is None:
+        index = {}
+        for idx, series in enumerate(data['series']):
+            if 'jellyfin_name' in series:
+                index.setdefault(series['jellyfin_name'], idx)
+            index.setdefault(series['name'], idx)
+        data['_series_index'] = index
+    return index.get(series_name, -1)
+
+def replace_series(data: Dict, series_idx: int, series: Dict):
+    """Replace a series in the database and keep the name index in sync"""
+    data['series'][series_idx] = series
+    if '_lower_names' in data:
+        data['_lower_names'][series_idx] = series['name'].lower()
+    data.pop('_name_corpus', None)
+    data.pop('_search_cache', None)
+    data.pop('_series_index', None)
+
+def strip_series_runtime_keys(series: Dict) -> Dict:
+    """The series without its cached in-memory fields (the same dict if it has none)"""
+    if '_counts' not in series:
+        return series
+    return {key: value for key, value in series.items() if not key.startswith('_')}
+
+def strip_runtime_keys(data: Dict) -> Dict:
+    """Shallow copy of the database without underscore-prefixed in-memory indexes"""
+    stripped = {key: value for key, value in data.items() if not key.startswith('_')}
+    if 'series' in stripped:
+        stripped['series'] = [strip_series_runtime_keys(series) for series in stripped['series']]
+    return stripped
+
+def annotate_counts(series: Dict) -> tuple:
+    """Count seasons, episodes and movies once and cache them on the series as '_counts'"""
+    counts = series.get('_counts')
+    if counts is None:
+        seasons = series.get('seasons', {})
+        counts = (
+            len(seasons),
+            sum(len(season.get('episodes', {})) for season in seasons.values()),
+            len(series.get('movies', {})),
+        )
+        series['_counts'] = counts
+    return counts
 
 def display_series_info(series: Dict):
     """Display detailed series information"""
@@ -52,97 +367,306 @@ def display_series_info(series: Dict):
     print(f"📅 Jellyfin Name: {series.get('jellyfin_name', 'N/A')}")
 
     # Count content
-    season_count = len(series.get('seasons', {}))
-    episode_count = sum(len(season.get('episodes', {})) for season in series.get('seasons', {}).values())
-    movie_count = len(series.get('movies', {}))
+    season_count, episode_count, movie_count = annotate_counts(series)
 
     print(f"📊 Seasons: {season_count} | Episodes: {episode_count} | Movies: {movie_count}")
     print("="*70)
 
-def update_series_simple(site: str, series_url: str, series_name: str = "Manual Update") -> Optional[Dict]:
-    """Update a series by running the scrapers directly"""
+def _import_file(module_name: str, path: Path):
+    """Import a module from a file path without registering it in sys.modules"""
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def load_site_script(site: str, script: str):
+    """Import a numbered scraper script from sites/<site>/ once and cache it"""
+    key = (site, script)
+    with _site_modules_lock:
+        if key not in _site_modules:
+            site_dir, _, _ = site_paths(site)
+
+            if (site, 'config') not in _site_modules:
+                _site_modules[(site, 'config')] = _import_file(f"{site}_config", site_dir / "config.py")
+
+            # The scripts do `import config`, so bind this site's config while importing
+            previous_config = sys.modules.get('config')
+            sys.modules['config'] = _site_modules[(site, 'config')]
+            try:
+                _site_modules[key] = _import_file(f"{site}_{script}", site_dir / f"{script}.py")
+            finally:
+                if previous_config is None:
+                    sys.modules.pop('config', None)
+                else:
+                    sys.modules['config'] = previous_config
+
+    return _site_modules[key]
+
+class _ThreadCapturedStdout:
+    """
+    Stand-in for sys.stdout that sends a thread's prints to its capture buffer (see capture_stdout)
+    Threads without one write to the real stdout; everything else is delegated to it
+    """
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
 
-    site_dir = Path(__file__).parent.parent / f"sites/{site}"
-    data_dir = site_dir / "data"
+    def _target(self):
+        buffer = getattr(self._local, 'buffer', None)
+        return self._stream if buffer is None else buffer
 
-    print(f"\n🔄 Updating series from {site}...")
-    print(f"📥 Fetching latest data for: {series_url}")
+    def write(self, text: str) -> int:
+        return self._target().write(text)
 
-    # Backup existing tmp files
-    tmp_files = ['tmp_name_url.json', 'tmp_season_episode_data.json', 'tmp_episode_streams.json']
-    backups = {}
-    for tmp_file in tmp_files:
-        tmp_path = data_dir / tmp_file
-        if tmp_path.exists():
-            backup_path = data_dir / f"{tmp_file}.backup"
-            shutil.copy(tmp_path, backup_path)
-            backups[tmp_file] = backup_path
+    def flush(self):
+        self._target().flush()
 
-    try:
-        # Create minimal catalog
-        catalog_data = {
-            "script": "manual_updater",
-            "total_series": 1,
-            "series": [{"name": series_name, "url": series_url}]
-        }
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+_stdout_install_lock = threading.Lock()
 
-        catalog_path = data_dir / "tmp_name_url.json"
-        with open(catalog_path, 'w', encoding='utf-8') as f:
-            json.dump(catalog_data, f, indent=2)
+@contextlib.contextmanager
+def capture_stdout(buffer: io.StringIO):
+    """
+    Collect the current thread's prints in buffer (unlike contextlib.redirect_stdout, other threads are unaffected)
+    Used so parallel updates don't interleave their progress on the console
+    """
+    with _stdout_install_lock:
+        if not isinstance(sys.stdout, _ThreadCapturedStdout):
+            sys.stdout = _ThreadCapturedStdout(sys.stdout)
+        proxy = sys.stdout
+    previous = getattr(proxy._local, 'buffer', None)
+    proxy._local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        proxy._local.buffer = previous
 
-        # Run structure analyzer (script 2)
-        print("🔍 Step 1/3: Analyzing structure...")
+def run_logged(cmd: List[str], timeout: int, cwd: Optional[Path] = None,
+               input_text: Optional[str] = None) -> tuple:
+    """
+    Run a command with stdout/stderr going to a temp file instead of a pipe
+    Returns (success, output); the output is only read back when the command failed
+    """
+    with tempfile.TemporaryFile() as log:
         result = subprocess.run(
-            ["python3", "2_url_season_episode_num.py", "--limit", "1"],
-            cwd=site_dir,
-            capture_output=True,
-            text=True,
-            timeout=120
+            cmd,
+            cwd=cwd,
+            input=input_text.encode('utf-8') if input_text is not None else None,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            timeout=timeout
         )
+        if result.returncode == 0:
+            return True, ""
+        log.seek(0)
+        return False, log.read().decode('utf-8', errors='replace')
 
-        if result.returncode != 0:
-            print(f"❌ Structure analysis failed")
-            print(result.stderr)
-            return None
+def run_quiet(cmd: List[str], timeout: int) -> tuple:
+    """
+    Run a command whose stdout is never used (discarded instead of piped and buffered)
+    Returns (success, stderr)
+    """
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        timeout=timeout
+    )
+    return result.returncode == 0, result.stderr
+
+def pipeline_in_process() -> bool:
+    """Whether pipeline steps run in-process (the default) rather than as subprocesses (JS_ISOLATE=1)"""
+    return os.environ.get('JS_ISOLATE') != '1'
+
+def update_workers() -> int:
+    """Number of series the batch updater runs at once (JS_UPDATE_PARALLEL, else UPDATE_WORKERS)"""
+    try:
+        return max(1, int(os.environ.get('JS_UPDATE_PARALLEL', UPDATE_WORKERS)))
+    except ValueError:
+        return UPDATE_WORKERS
 
-        # Run streams analyzer (script 3)
-        print("🔍 Step 2/3: Analyzing streams...")
-        result = subprocess.run(
-            ["python3", "3_language_streamurl.py", "--limit", "1"],
-            cwd=site_dir,
-            capture_output=True,
-            text=True,
-            timeout=600
-        )
+def run_pipeline_step(site: str, script: str, limit: Optional[int], timeout: int,
+                      options: Optional[Dict] = None, isolated: bool = False) -> tuple:
+    """
+    Run one scraper script for a site and return (success, output)
+    Runs in-process to skip interpreter startup; set JS_ISOLATE=1 (or isolated=True) to use a subprocess instead
+    Extra options are passed to run() as keyword arguments, or as --flag value on the command line
+    """
+    site_dir, site_data_dir, _ = site_paths(site)
+    options = options or {}
+
+    if isolated or not pipeline_in_process():
+        cmd = ["python3", f"{script}.py"]
+        if limit:
+            cmd += ["--limit", str(limit)]
+        for name, value in options.items():
+            flag = f"--{name.replace('_', '-')}"
+            if value is True:
+                cmd.append(flag)
+            elif value is not None and value is not False:
+                cmd += [flag, str(value)]
+        return run_logged(cmd, timeout, cwd=site_dir)
+
+    # Scripts resolve their data files against data_dir (no chdir, so parallel updates can run in-process)
+    options = {'data_dir': str(site_data_dir), **options}
+    output = io.StringIO()
+    result = {}
+
+    def run_step():
+        with capture_stdout(output):
+            try:
+                module = load_site_script(site, script)
+                result['success'] = module.run(limit=limit, **options)
+            except Exception:
+                output.write(traceback.format_exc())
+
+    # Same per-step timeout as the subprocess path. A thread can't be killed, so a hung step is
+    # left behind as a daemon thread (it ends with the process) and the step counts as failed
+    step_thread = threading.Thread(target=run_step, name=f"{site}/{script}", daemon=True)
+    step_thread.start()
+    step_thread.join(timeout)
+    if step_thread.is_alive():
+        return False, output.getvalue() + f"\n❌ {script} timed out after {timeout}s\n"
+
+    return bool(result.get('success')), output.getvalue()
+
+def fetch_page_validators(url: str) -> Optional[Dict]:
+    """HEAD a page and return its ETag/Last-Modified, or None if it has neither (or the request failed)"""
+    request = urllib.request.Request(url, method="HEAD", headers={
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+    })
+    try:
+        with urllib.request.urlopen(request, timeout=10) as response:
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }
+    except Exception:
+        return None
 
-        if result.returncode != 0:
-            print(f"❌ Stream analysis failed")
-            print(result.stderr)
-            return None
+    if not any(validators.values()):
+        return None
+    return validators
+
+def _valid_update_cache_entry(entry) -> bool:
+    """Whether an update cache entry has everything a cache hit needs (old or hand-edited ones may not)"""
+    return (isinstance(entry, dict)
+            and isinstance(entry.get('validators'), dict)
+            and isinstance(entry.get('ts'), (int, float))
+            and isinstance(entry.get('outputs'), dict)
+            and all(script in entry['outputs'] for script in CACHED_STEP_OUTPUTS))
+
+def load_update_cache() -> Dict:
+    """Load the per-series scraper output cache; malformed entries are dropped (treated as misses)"""
+    try:
+        cache = read_json_file(UPDATE_CACHE_FILE)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {url: entry for url, entry in cache.items() if _valid_update_cache_entry(entry)}
+
+def save_update_cache(cache: Dict):
+    """Save the scraper output cache, dropping expired entries"""
+    now = time.time()
+    fresh = {url: entry for url, entry in cache.items() if now - entry.get('ts', 0) < UPDATE_CACHE_TTL}
+    try:
+        write_json_file(UPDATE_CACHE_FILE, fresh)
+    except OSError as e:
+        print(f"⚠️  Could not save update cache: {e}")
+
+def store_update_cache_entry(series_url: str, entry: Dict):
+    """Add one entry to the update cache (safe to call from parallel updates)"""
+    with _update_cache_lock:
+        cache = load_update_cache()
+        cache[series_url] = entry
+        save_update_cache(cache)
+
+def update_series_simple(site: str, series_url: str, series_name: str = "Manual Update",
+                         work_dir: Optional[Path] = None) -> Optional[Dict]:
+    """
+    Update a series by running the scrapers directly
+    The scrapers always work in a private tmp folder (work_dir, or a fresh one next to the site's data), so
+    the site's own tmp files are never touched, several updates can run at once, and a step abandoned
+    after a timeout can only write into a folder that is thrown away
+    """
+    site_dir, site_data_dir, _ = site_paths(site)
+    if work_dir is None:
+        with tempfile.TemporaryDirectory(prefix="update_", dir=site_data_dir, ignore_cleanup_errors=True) as tmp_dir:
+            return update_series_simple(site, series_url, series_name, Path(tmp_dir))
 
-        # Run JSON structurer (script 4)
-        print("🔍 Step 3/3: Structuring data...")
-        result = subprocess.run(
-            ["python3", "4_json_structurer.py"],
-            cwd=site_dir,
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
+    # Absolute, since subprocess steps run with the site directory as cwd
+    data_dir = Path(work_dir).resolve()
+    # Script 4 writes just the updated series record here instead of the full database
+    updated_path = data_dir / "tmp_updated_series.json"
 
-        if result.returncode != 0:
-            print(f"❌ JSON structuring failed")
-            print(result.stderr)
-            return None
+    print(f"\n🔄 Updating series from {site}...")
+    print(f"📥 Fetching latest data for: {series_url}")
 
-        # Load the final structured data
-        final_path = data_dir / "final_series_data.json"
-        if final_path.exists():
-            with open(final_path, 'r', encoding='utf-8') as f:
-                final_data = json.load(f)
-                if final_data['series']:
-                    print("✅ Series data updated successfully")
-                    return final_data['series'][0]
+    try:
+        # Create minimal catalog
+        catalog_data = {
+            "script": "manual_updater",
+            "total_series": 1,
+            "series": [{"name": series_name, "url": series_url}]
+        }
+
+        # In-process steps get the catalog directly; subprocesses read it from tmp_name_url.json
+        in_process = pipeline_in_process()
+        if not in_process:
+            # Fixed shape, so only the two strings need encoding
+            catalog_json = (
+                '{"script":"manual_updater","total_series":1,'
+                f'"series":[{{"name":{json.dumps(series_name)},"url":{json.dumps(series_url)}}}]}}'
+            )
+            (data_dir / "tmp_name_url.json").write_text(catalog_json, encoding='utf-8')
+
+        # Reuse the outputs of scripts 2 and 3 if the series page hasn't changed
+        validators = fetch_page_validators(series_url)
+        update_cache = load_update_cache()
+        entry = update_cache.get(series_url)
+        steps = PIPELINE_STEPS
+        if (validators and entry and entry.get('validators') == validators
+                and time.time() - entry.get('ts', 0) < UPDATE_CACHE_TTL):
+            print("⚡ Series page unchanged - reusing cached structure and streams")
+            for script, filename in CACHED_STEP_OUTPUTS.items():
+                write_json_file(data_dir / filename, entry['outputs'][script])
+            steps = [step for step in PIPELINE_STEPS if step[0] not in CACHED_STEP_OUTPUTS]
+
+        # Run structure analyzer, streams analyzer and JSON structurer (scripts 2-4)
+        for step, (script, label, failure, limit, timeout) in enumerate(steps, 1):
+            print(f"🔍 Step {step}/{len(steps)}: {label}...")
+            options = {'data_dir': str(data_dir)}
+            if script == "4_json_structurer":
+                options.update(output_file=str(updated_path), single_series=True)
+            if in_process and script in CATALOG_STEPS:
+                options['catalog'] = catalog_data
+            success, output = run_pipeline_step(site, script, limit, timeout, options, isolated=not in_process)
+
+            if not success:
+                print(f"❌ {failure}")
+                print(output)
+                return None
+
+        if validators and steps is PIPELINE_STEPS:
+            store_update_cache_entry(series_url, {
+                'validators': validators,
+                'ts': time.time(),
+                'outputs': {script: read_json_file(data_dir / filename)
+                            for script, filename in CACHED_STEP_OUTPUTS.items()},
+            })
+
+        # Load the structured series
+        try:
+            updated_series = read_json_file(updated_path)
+        except FileNotFoundError:
+            updated_series = None
+        if updated_series:
+            print("✅ Series data updated successfully")
+            return updated_series
 
         print("❌ No updated data found")
         return None
@@ -152,32 +676,38 @@ def update_series_simple(site: str, series_url: str, series_name: str = "Manual
         return None
     except Exception as e:
         print(f"❌ Update failed: {e}")
-        import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return None
     finally:
-        # Restore backups
-        for tmp_file, backup_path in backups.items():
-            if backup_path.exists():
-                shutil.copy(backup_path, data_dir / tmp_file)
-                backup_path.unlink()
+        updated_path.unlink(missing_ok=True)
+
+def write_database_digest(db_path: Path, digest: str):
+    """Record a database's SHA-256 in <name>.sha256, together with the size/mtime it belongs to"""
+    stat = db_path.stat()
+    db_path.with_suffix('.json.sha256').write_text(f"{digest} {stat.st_size} {stat.st_mtime_ns}\n")
+
+def database_digest(db_path: Path) -> str:
+    """SHA-256 of a database file: from the .sha256 sidecar if it still matches the file, else hashed now"""
+    stat = db_path.stat()
+    try:
+        digest, size, mtime_ns = db_path.with_suffix('.json.sha256').read_text().split()
+        if int(size) == stat.st_size and int(mtime_ns) == stat.st_mtime_ns:
+            return digest
+    except (OSError, ValueError):
+        pass
+    with open(db_path, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
 
 def save_database(data: Dict, db_path: Path, create_backup: bool = True):
     """Save updated database"""
     try:
-        backup_path = db_path.with_suffix('.json.backup')
-
         if create_backup:
-            # Create backup
-            with open(db_path, 'r', encoding='utf-8') as f:
-                backup_data = f.read()
-            with open(backup_path, 'w', encoding='utf-8') as f:
-                f.write(backup_data)
+            backup_path = backup_database(db_path)
             print(f"💾 Backup created: {backup_path}")
 
-        # Save updated data
-        with open(db_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Save updated data, and record its hash so unchanged pushes can be skipped
+        payload = write_json_file(db_path, strip_runtime_keys(data), fsync=True)
+        write_database_digest(db_path, hashlib.sha256(payload).hexdigest())
 
         print(f"✅ Database saved to: {db_path}")
         return True
@@ -185,186 +715,234 @@ def save_database(data: Dict, db_path: Path, create_backup: bool = True):
         print(f"❌ Error saving database: {e}")
         return False
 
-def update_jellyfin_structure(site: str, series_name: str) -> bool:
+def build_temp_database_json(series_list: List[Dict]) -> str:
+    """Serialise the structurer's temp database: the envelope is fixed, only the series need encoding"""
+    if ORJSON_AVAILABLE:
+        encoded = [orjson.dumps(series, option=orjson.OPT_NON_STR_KEYS).decode('utf-8') for series in series_list]
+    else:
+        encoded = [json.dumps(series, ensure_ascii=False, separators=(',', ':')) for series in series_list]
+    return f'{{"series":[{",".join(encoded)}],"script":"manual_updater_structure"}}'
+
+def build_remote_structure_script(site: str, series_folders: List[str], temp_db_json: str) -> str:
     """
-    Regenerate Jellyfin folder structure for a specific series
-    Uses the 7_jellyfin_structurer.py script with series name filter
+    Build a bash script that regenerates the given series' folders on the Jellyfin server
+    The temp database is embedded as a heredoc so no separate scp is needed
+    """
+    marker = "JELLYSTREAM_TEMP_DB_EOF"
+    return "\n".join([
+        *(f"rm -rf {shlex.quote(folder)}" for folder in series_folders),
+        f"cd {shlex.quote(f'/opt/JellyStream/sites/{site}')} || exit 1",
+        # Move the full database aside (a rename, not a copy) and write the temp one in its place
+        "mv data/final_series_data.json data/final_series_data.json.temp_backup || exit 1",
+        f"cat > data/final_series_data.json <<'{marker}'",
+        temp_db_json,
+        marker,
+        # stdin is this script (bash -s); the structurer must not read the rest of it
+        "python3 7_jellyfin_structurer.py --api-url http://localhost:3000/stream/redirect --clear-progress </dev/null",
+        "status=$?",
+        # Always put the full database back, even if the structurer failed
+        "mv data/final_series_data.json.temp_backup data/final_series_data.json",
+        "exit $status",
+        ""
+    ])
+
+def regenerate_series_structures(site: str, series_list: List[Dict], location: Optional[str] = None) -> bool:
+    """
+    Regenerate Jellyfin folder structures for the given series objects of one site
+    All series go into one temp database, so the structurer (and on the code server, SSH) runs once
     """
     try:
-        print(f"\n📁 Regenerating Jellyfin structure for: {series_name}")
-
-        # Create temp JSON with just this series for structurer
-        site_dir = Path(__file__).parent.parent / f"sites/{site}"
-        data_dir = site_dir / "data"
+        site_dir, _, final_file = site_paths(site)
+        target_series_list = [strip_series_runtime_keys(series) for series in series_list]
 
-        # Load full database
-        with open(data_dir / "final_series_data.json", 'r', encoding='utf-8') as f:
-            full_data = json.load(f)
+        jellyfin_names = [series.get('jellyfin_name', series['name']) for series in target_series_list]
+        series_folders = [f"/media/jellyfin/{site}/{jellyfin_name}" for jellyfin_name in jellyfin_names]
 
-        # Find the series
-        target_series = None
-        for series in full_data['series']:
-            if series.get('jellyfin_name') == series_name or series['name'] == series_name:
-                target_series = series
-                break
-
-        if not target_series:
-            print(f"❌ Series not found in database: {series_name}")
-            return False
-
-        jellyfin_name = target_series.get('jellyfin_name', target_series['name'])
-
-        # Remove old folder on Jellyfin server
-        print(f"🗑️  Removing old folder: {jellyfin_name}")
-        result = subprocess.run(
-            ["ssh", "jellyfin", f"rm -rf '/media/jellyfin/{site}/{jellyfin_name}'"],
-            capture_output=True,
-            timeout=10
-        )
+        # Check if we're on Jellyfin or code server
+        if location is None:
+            location = check_location()
 
-        if result.returncode == 0:
-            print(f"✅ Old folder removed")
+        # Remove old folders on Jellyfin server (done inside the remote script on code server)
+        if location == "jellyfin":
+            for jellyfin_name, series_folder in zip(jellyfin_names, series_folders):
+                print(f"🗑️  Removing old folder: {jellyfin_name}")
+                shutil.rmtree(series_folder, ignore_errors=True)
+            print(f"✅ Old folders removed")
 
-        # Create temp database with just this series
-        temp_data = {
-            "series": [target_series],
-            "script": "manual_updater_structure"
-        }
-
-        temp_db_path = data_dir / "temp_single_series.json"
-        with open(temp_db_path, 'w', encoding='utf-8') as f:
-            json.dump(temp_data, f, indent=2, ensure_ascii=False)
+        # Create temp database with just these series
+        temp_db_json = build_temp_database_json(target_series_list)
 
         # Run structurer script with the temp database
         print(f"📝 Generating new structure...")
 
-        # Import and run structurer directly
-        import sys
-        sys.path.insert(0, str(site_dir))
-
-        # Backup original final file
-        final_file = data_dir / "final_series_data.json"
-        final_backup = data_dir / "final_series_data.json.temp_backup"
-        shutil.copy(final_file, final_backup)
-
-        # Temporarily replace with single series
-        shutil.copy(temp_db_path, final_file)
+        final_backup = final_file.with_suffix('.json.temp_backup')
+        swapped = False
 
         try:
-            # Check if we're on Jellyfin or code server
-            location = check_location()
-
             if location == "jellyfin":
+                # Move the full database aside (a rename, not a copy) and write the temp one in its place
+                final_file.replace(final_backup)
+                swapped = True
+                final_file.write_text(temp_db_json, encoding='utf-8')
+
                 # Run locally on Jellyfin server
-                result = subprocess.run(
+                success, output = run_logged(
                     ["python3", "7_jellyfin_structurer.py", "--api-url", "http://localhost:3000/stream/redirect", "--clear-progress"],
-                    cwd=site_dir,
-                    capture_output=True,
-                    text=True,
-                    timeout=60
+                    timeout=60 * len(target_series_list),
+                    cwd=site_dir
                 )
             else:
-                # Push temp database to Jellyfin first
-                temp_jellyfin_path = f"/opt/JellyStream/sites/{site}/data/temp_single_series.json"
-                result = subprocess.run(
-                    ["scp", str(temp_db_path), f"jellyfin:{temp_jellyfin_path}"],
-                    capture_output=True,
-                    timeout=30
-                )
-
-                if result.returncode != 0:
-                    print(f"❌ Failed to copy temp database to Jellyfin")
-                    return False
-
-                # Run structurer on Jellyfin server via SSH
-                result = subprocess.run(
-                    ["ssh", "jellyfin",
-                     f"cd /opt/JellyStream/sites/{site} && "
-                     f"cp data/final_series_data.json data/final_series_data.json.temp_backup && "
-                     f"cp data/temp_single_series.json data/final_series_data.json && "
-                     f"python3 7_jellyfin_structurer.py --api-url http://localhost:3000/stream/redirect --clear-progress && "
-                     f"cp data/final_series_data.json.temp_backup data/final_series_data.json && "
-                     f"rm data/final_series_data.json.temp_backup data/temp_single_series.json"],
-                    capture_output=True,
-                    text=True,
-                    timeout=60
+                # Remove the old folders, upload the temp database and run the structurer
+                # in one SSH session instead of separate ssh/scp/ssh round-trips
+                for jellyfin_name in jellyfin_names:
+                    print(f"🗑️  Removing old folder: {jellyfin_name}")
+                remote_script = build_remote_structure_script(site, series_folders, temp_db_json)
+                success, output = run_logged(
+                    ssh_command("bash -s"),
+                    timeout=100 * len(target_series_list),
+                    input_text=remote_script
                 )
 
-            if result.returncode == 0:
+            if success:
                 print(f"✅ Structure generated successfully")
                 return True
             else:
                 print(f"❌ Structure generation failed:")
-                print(result.stderr)
+                print(output)
                 return False
 
         finally:
-            # Restore original database (only on code server)
-            if check_location() == "codeserver":
-                shutil.copy(final_backup, final_file)
-                final_backup.unlink()
-                temp_db_path.unlink()
-            else:
-                # Clean up temp files on Jellyfin
-                shutil.copy(final_backup, final_file)
-                final_backup.unlink()
-                temp_db_path.unlink()
+            # Put the full database back (the code server's local copy is never touched)
+            if swapped:
+                final_backup.replace(final_file)
 
     except Exception as e:
         print(f"❌ Error updating structure: {e}")
-        import traceback
-        traceback.print_exc()
+        traceback.print_exc(file=sys.stdout)
         return False
 
-def push_to_jellyfin(site: str, db_path: Path) -> bool:
-    """Push updated database to Jellyfin server"""
+def _remote_api_loaded_at() -> Optional[float]:
+    """When the Jellyfin API last loaded its data (from /health), or None if unknown"""
     try:
-        # Fixed path
-        jellyfin_path = f"/opt/JellyStream/sites/{site}/data/final_series_data.json"
+        result = subprocess.run(
+            ssh_command("curl", "-s", "http://localhost:3000/health"),
+            capture_output=True,
+            text=True,
+            timeout=10
+        )
+        return json.loads(result.stdout).get('loaded_at')
+    except Exception:
+        return None
 
-        print(f"\n📤 Pushing database to Jellyfin server...")
+def reload_jellyfin_api():
+    """
+    Make the Jellyfin API pick up pushed databases
+    Sends SIGHUP (reload in place) and waits for /health to report fresh data; restarts the service if it doesn't
+    """
+    print("🔄 Reloading API...")
+    loaded_at = _remote_api_loaded_at()
+    if loaded_at is not None:
+        success, _ = run_quiet(ssh_command("systemctl kill -s HUP jellystream-api"), timeout=10)
+        if success:
+            deadline = time.time() + API_RELOAD_TIMEOUT
+            while time.time() < deadline:
+                time.sleep(1)
+                current = _remote_api_loaded_at()
+                if current is not None and current != loaded_at:
+                    print("✅ API reloaded")
+                    return
+
+    # Older API without reload support, or the reload didn't finish in time
+    print("🔄 Restarting API...")
+    success, error = run_quiet(ssh_command("systemctl restart jellystream-api"), timeout=10)
+    if success:
+        print("✅ API restarted")
+    else:
+        print(f"❌ API restart failed: {error.strip()}")
+
+def push_to_jellyfin(databases: List[tuple]) -> bool:
+    """
+    Push updated databases to Jellyfin server
+    databases is a list of (site, db_path); the copies run concurrently and the API restarts once
+    Databases identical to the server's copy (same SHA-256) are skipped, and if all are, so is the reload
+    """
+    def remote_digest(jellyfin_path: str) -> Optional[str]:
+        # Hashed on the server itself, so changes made there (e.g. by the scrapers) are always seen
         result = subprocess.run(
-            ["scp", str(db_path), f"jellyfin:{jellyfin_path}"],
+            ssh_command("sha256sum", shlex.quote(jellyfin_path)),
             capture_output=True,
             text=True,
             timeout=30
         )
+        return result.stdout.split()[0] if result.returncode == 0 and result.stdout else None
 
-        if result.returncode == 0:
-            print("✅ Database pushed to Jellyfin server")
-
-            # Restart API with correct service name
-            print("🔄 Restarting API...")
-            subprocess.run(
-                ["ssh", "jellyfin", "systemctl restart jellystream-api"],
-                capture_output=True,
-                timeout=10
-            )
-            print("✅ API restarted")
-            return True
-        else:
-            print(f"❌ Push failed: {result.stderr}")
-            return False
+    def copy_database(site: str, db_path: Path):
+        # Fixed path
+        jellyfin_path = f"/opt/JellyStream/sites/{site}/data/final_series_data.json"
+        try:
+            if database_digest(db_path) == remote_digest(jellyfin_path):
+                return True, None  # None output: nothing needed copying
+        except Exception:
+            pass  # Can't compare - just push
+        if shutil.which("rsync"):
+            # zstd compresses JSON better and faster than zlib; the server's rsync must support it too
+            choices = ["zstd", None] if rsync_supports_zstd() else [None]
+            for compress_choice in choices:
+                success, output = run_logged(rsync_command(str(db_path), jellyfin_path, compress_choice), timeout=30)
+                if success:
+                    return success, output
+            # e.g. rsync missing on the server - fall back to a full copy
+        # scp truncates and rewrites its target in place, so copy next to the database and rename it
+        # over (like rsync does); hardlinked backups on the server keep the old contents
+        tmp_path = f"{jellyfin_path}.tmp"
+        success, output = run_logged(scp_command(str(db_path), tmp_path), timeout=30)
+        if not success:
+            return success, output
+        return run_logged(ssh_command("mv", "-f", shlex.quote(tmp_path), shlex.quote(jellyfin_path)), timeout=10)
+
+    try:
+        print(f"\n📤 Pushing {len(databases)} database(s) to Jellyfin server...")
+        with ThreadPoolExecutor(max_workers=len(databases)) as executor:
+            futures = [(site, executor.submit(copy_database, site, db_path)) for site, db_path in databases]
+
+        pushed = 0
+        unchanged = 0
+        for site, future in futures:
+            try:
+                success, output = future.result()
+            except Exception as e:
+                print(f"❌ Push failed ({site}): {e}")
+                continue
+            if success and output is None:
+                print(f"ℹ️  Jellyfin server already has this database ({site}) - skipped")
+                unchanged += 1
+            elif success:
+                print(f"✅ Database pushed to Jellyfin server ({site})")
+                pushed += 1
+            else:
+                print(f"❌ Push failed ({site}): {output}")
+
+        if not pushed:
+            return unchanged == len(databases)
+
+        reload_jellyfin_api()
+        return pushed + unchanged == len(databases)
 
     except Exception as e:
         print(f"❌ Error pushing to Jellyfin: {e}")
         return False
 
+@functools.lru_cache(maxsize=1)
 def check_location():
-    """Check if we're running on code server or Jellyfin server"""
+    """Check if we're running on code server or Jellyfin server (cached, the host doesn't change)"""
     try:
-        hostname = subprocess.run(
-            ["hostname"],
-            capture_output=True,
-            text=True,
-            timeout=5
-        ).stdout.strip()
+        hostname = socket.gethostname()
 
         if "jellyfin" in hostname.lower():
             return "jellyfin"
         else:
             return "codeserver"
-    except:
+    except OSError:
         return "unknown"
 
 def main():
@@ -377,14 +955,23 @@ def main():
     location = check_location()
     print(f"\n📍 Running on: {location}")
 
-    # Load both databases
-    print("\n📚 Loading databases...")
-    serienstream_data, serienstream_path = load_database("serienstream")
-    aniworld_data, aniworld_path = load_database("aniworld")
+    # Open one SSH connection up front for the push/structure steps
+    if location == "codeserver":
+        open_ssh_master()
 
-    if not serienstream_data and not aniworld_data:
-        print("❌ No databases could be loaded!")
+    # Databases are only loaded once their site is picked; the menu just checks which exist
+    available = {site: site_paths(site)[2].exists() for site in ("serienstream", "aniworld")}
+    if not any(available.values()):
+        print("❌ No databases found!")
         return
+    databases = {}
+
+    def get_db(site: str) -> tuple:
+        """(data, db_path) of a site, loaded on first use"""
+        if site not in databases:
+            print(f"\n📚 Loading {site} database...")
+            databases[site] = load_database(site)
+        return databases[site]
 
     # Collect series to update
     series_to_update = []  # List of (site_name, data, db_path, series_idx, series)
@@ -392,9 +979,9 @@ def main():
     while True:
         print("\n" + "="*70)
         print("Select site to update:")
-        if serienstream_data:
+        if available["serienstream"]:
             print("  1. SerienStream")
-        if aniworld_data:
+        if available["aniworld"]:
             print("  2. Aniworld")
         print("  0. Exit")
         print("="*70)
@@ -404,18 +991,20 @@ def main():
         if choice == "0":
             print("👋 Goodbye!")
             break
-        elif choice == "1" and serienstream_data:
+        elif choice == "1" and available["serienstream"]:
             site_name = "serienstream"
-            data = serienstream_data
-            db_path = serienstream_path
-        elif choice == "2" and aniworld_data:
+        elif choice == "2" and available["aniworld"]:
             site_name = "aniworld"
-            data = aniworld_data
-            db_path = aniworld_path
         else:
             print("❌ Invalid choice")
             continue
 
+        data, db_path = get_db(site_name)
+        if not data:
+            # Couldn't be loaded - drop it from the menu
+            available[site_name] = False
+            continue
+
         # Search for series
         query = input("\n🔍 Search for series: ").strip()
         if not query:
@@ -495,10 +1084,8 @@ def main():
     if create_backup:
         for site_name, data, db_path, _, _ in series_to_update:
             if db_path not in backups_created:
-                backup_path = Path(str(db_path) + '.backup')
                 try:
-                    with open(backup_path, 'w', encoding='utf-8') as f:
-                        json.dump(data, f, indent=2, ensure_ascii=False)
+                    backup_path = backup_database(db_path)
                     backups_created[db_path] = backup_path
                     print(f"💾 Backup created: {backup_path}")
                 except Exception as e:
@@ -513,21 +1100,48 @@ def main():
     print("🔄 Starting batch update...")
     print("="*70)
 
-    updated_series_list = []
-    for i, (site_name, data, db_path, series_idx, series) in enumerate(series_to_update, 1):
-        print(f"\n[{i}/{len(series_to_update)}] Updating: {series['name']}")
+    workers = min(update_workers(), len(series_to_update))
 
-        # Update series data
-        updated_series = update_series_simple(site_name, series['url'], series['name'])
+    def run_update(job: tuple) -> tuple:
+        """Update one series; returns (updated series or None, its console output if captured)"""
+        site_name, data, db_path, series_idx, series = job
+        if workers == 1:
+            return update_series_simple(site_name, series['url'], series['name']), ""
+        # Parallel updates (each in its own tmp folder) collect their output per series
+        # instead of interleaving it on the console
+        output = io.StringIO()
+        with capture_stdout(output):
+            updated_series = update_series_simple(site_name, series['url'], series['name'])
+        return updated_series, output.getvalue()
 
-        if not updated_series:
-            print(f"❌ Update failed for: {series['name']}")
-            continue
+    updated_series_list = []
+    changed_dbs = set()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(run_update, job): job for job in series_to_update}
+        # Databases are only touched here, on the main thread, as results come in
+        for i, future in enumerate(as_completed(futures), 1):
+            site_name, data, db_path, series_idx, series = futures[future]
+            print(f"\n[{i}/{len(series_to_update)}] Finished: {series['name']}")
+            try:
+                updated_series, output = future.result()
+                if output:
+                    print(output.rstrip("\n"))
+            except Exception as e:
+                print(f"❌ Update error: {e}")
+                updated_series = None
+
+            if not updated_series:
+                print(f"❌ Update failed for: {series['name']}")
+                continue
 
-        # Replace in database
-        data['series'][series_idx] = updated_series
-        print(f"✅ Updated: {series['name']}")
-        updated_series_list.append((site_name, data, db_path, updated_series))
+            # Replace in database (unchanged series leave the file untouched)
+            if updated_series == strip_series_runtime_keys(series):
+                print(f"ℹ️  No changes for: {series['name']}")
+            else:
+                replace_series(data, series_idx, updated_series)
+                changed_dbs.add(db_path)
+                print(f"✅ Updated: {series['name']}")
+            updated_series_list.append((site_name, data, db_path, updated_series))
 
     # Save all databases
     print("\n" + "="*70)
@@ -536,6 +1150,8 @@ def main():
 
     saved_dbs = {}
     for site_name, data, db_path, updated_series in updated_series_list:
+        if db_path not in changed_dbs:
+            continue
         if db_path not in saved_dbs:
             if save_database(data, db_path, create_backup=False):
                 saved_dbs[db_path] = (site_name, data, db_path)
@@ -544,27 +1160,58 @@ def main():
     if location == "codeserver" and saved_dbs:
         push = input("\n📤 Push databases to Jellyfin server? (y/n): ").strip().lower()
         if push == 'y':
-            for db_path, (site_name, data, path) in saved_dbs.items():
-                push_to_jellyfin(site_name, path)
+            push_to_jellyfin([(site_name, path) for site_name, data, path in saved_dbs.values()])
     elif saved_dbs:
         print("💡 Already on Jellyfin server - databases updated locally")
+    if not changed_dbs:
+        print("ℹ️  No database changes - nothing to save")
 
     # Ask about structure update
     structure = input("\n📁 Update Jellyfin folder structures? (y/n): ").strip().lower()
     if structure == 'y':
         print("\n🔄 Updating Jellyfin structures...")
+        # One structurer run per site covering all of its updated series
+        series_by_site = {}
         for site_name, data, db_path, updated_series in updated_series_list:
-            jellyfin_name = updated_series.get('jellyfin_name', updated_series['name'])
-            print(f"\n📁 {jellyfin_name}...")
-            update_jellyfin_structure(site_name, jellyfin_name)
+            series_by_site.setdefault(site_name, []).append(updated_series)
+        for site_name, site_series in series_by_site.items():
+            jellyfin_names = [series.get('jellyfin_name', series['name']) for series in site_series]
+            print(f"\n📁 {site_name}: {', '.join(jellyfin_names)}...")
+            regenerate_series_structures(site_name, site_series, location)
 
     print("\n" + "="*70)
     print(f"✅ Batch update complete! ({len(updated_series_list)}/{len(series_to_update)} succeeded)")
     print("="*70)
 
+def plugin_series_entry(series: Dict) -> Dict:
+    """Summary of a series as listed by --list-series/--search"""
+    season_count, episode_count, _ = annotate_counts(series)
+    return {
+        "name": series['name'],
+        "jellyfin_name": series.get('jellyfin_name', series['name']),
+        "url": series['url'],
+        "season_count": season_count,
+        "episode_count": episode_count
+    }
+
+def write_series_list(series_iter) -> None:
+    """
+    Stream {"success": true, "series": [...]} to stdout one entry at a time
+    so no full list of entries (or one big JSON string) is held for large databases
+    """
+    sys.stdout.flush()
+    out = sys.stdout.buffer
+    out.write(b'{"success":true,"series":[')
+    for i, series in enumerate(series_iter):
+        if i:
+            out.write(b',')
+        entry = plugin_series_entry(series)
+        out.write(orjson.dumps(entry) if ORJSON_AVAILABLE else json.dumps(entry).encode())
+    out.write(b']}\n')
+    out.flush()
+
 def plugin_mode():
     """Plugin mode - accepts command line arguments for non-interactive use"""
-    import argparse
 
     parser = argparse.ArgumentParser(description='Manual Series Updater - Plugin Mode')
     parser.add_argument('--plugin', action='store_true', help='Enable plugin mode (non-interactive)')
@@ -573,9 +1220,13 @@ def plugin_mode():
     parser.add_argument('--list-series', action='store_true', help='List all series as JSON')
     parser.add_argument('--search', help='Search for series (returns JSON)')
     parser.add_argument('--json', action='store_true', help='Output as JSON for plugin consumption')
+    parser.add_argument('--pretty', metavar='PATH', help='Write an indented, human-readable copy of the database to PATH')
 
     args = parser.parse_args()
 
+    if args.pretty and not args.plugin:
+        parser.error("--pretty requires --plugin (and --site)")
+
     if not args.plugin:
         # Not in plugin mode, run interactive
         main()
@@ -597,45 +1248,31 @@ def plugin_mode():
                 print(f"❌ Database not found for {args.site}")
             sys.exit(1)
 
+        # Handle pretty export (the database itself stays compact)
+        if args.pretty:
+            write_json_file(Path(args.pretty), strip_runtime_keys(data), pretty=True)
+            if args.json:
+                print(json.dumps({"success": True, "message": f"Database written to {args.pretty}"}))
+            else:
+                print(f"✅ Database written to: {args.pretty}")
+            return
+
         # Handle list command
         if args.list_series:
-            series_list = []
-            for idx, series in enumerate(data['series']):
-                series_list.append({
-                    "name": series['name'],
-                    "jellyfin_name": series.get('jellyfin_name', series['name']),
-                    "url": series['url'],
-                    "season_count": len(series.get('seasons', {})),
-                    "episode_count": sum(len(season.get('episodes', {})) for season in series.get('seasons', {}).values())
-                })
-            print(json.dumps({"success": True, "series": series_list}))
+            write_series_list(data['series'])
             return
 
         # Handle search command
         if args.search:
             results = search_series(data, args.search)
-            series_list = []
-            for idx, series in results[:50]:  # Limit to 50 results
-                series_list.append({
-                    "name": series['name'],
-                    "jellyfin_name": series.get('jellyfin_name', series['name']),
-                    "url": series['url'],
-                    "season_count": len(series.get('seasons', {})),
-                    "episode_count": sum(len(season.get('episodes', {})) for season in series.get('seasons', {}).values())
-                })
+            series_list = [plugin_series_entry(series) for _, series in results[:50]]  # Limit to 50 results
             print(json.dumps({"success": True, "count": len(results), "series": series_list}))
             return
 
         # Handle update command
         # Find series
-        target_series = None
-        series_idx = -1
-        for idx, series in enumerate(data['series']):
-            jellyfin_name = series.get('jellyfin_name', series['name'])
-            if jellyfin_name == args.series_name or series['name'] == args.series_name:
-                target_series = series
-                series_idx = idx
-                break
+        series_idx = find_series_index(data, args.series_name)
+        target_series = data['series'][series_idx] if series_idx >= 0 else None
 
         if not target_series:
             if args.json:
@@ -655,25 +1292,26 @@ def plugin_mode():
                 print(json.dumps({"success": False, "error": "Update failed"}))
             sys.exit(1)
 
-        # Replace in database
-        data['series'][series_idx] = updated_series
+        # Replace in database and save, unless the scrape came back identical
+        if updated_series != strip_series_runtime_keys(target_series):
+            replace_series(data, series_idx, updated_series)
 
-        # Save database
-        if not save_database(data, db_path, create_backup=True):
-            if args.json:
-                print(json.dumps({"success": False, "error": "Failed to save database"}))
-            sys.exit(1)
+            if not save_database(data, db_path, create_backup=True):
+                if args.json:
+                    print(json.dumps({"success": False, "error": "Failed to save database"}))
+                sys.exit(1)
 
         # Update Jellyfin structure
         jellyfin_name = updated_series.get('jellyfin_name', updated_series['name'])
-        if not update_jellyfin_structure(args.site, jellyfin_name):
+        print(f"\n📁 Regenerating Jellyfin structure for: {jellyfin_name}")
+        if not regenerate_series_structures(args.site, [updated_series]):
             if args.json:
                 print(json.dumps({"success": False, "error": "Failed to regenerate .strm files"}))
             sys.exit(1)
 
         # Success
         if args.json:
-            episode_count = sum(len(season.get('episodes', {})) for season in updated_series.get('seasons', {}).values())
+            _, episode_count, _ = annotate_counts(updated_series)
             print(json.dumps({
                 "success": True,
                 "series": args.series_name,
@@ -688,7 +1326,6 @@ def plugin_mode():
             print(json.dumps({"success": False, "error": str(e)}))
         else:
             print(f"❌ Error: {e}")
-        import traceback
         traceback.print_exc()
         sys.exit(1)
 